@@ -28,6 +28,9 @@ export function useFrontierEvents(options: UseFrontierEventsOptions = {}) {
   const setEvents = useEventStore((state) => state.setEvents);
   const pollRef = useRef<NodeJS.Timeout>();
   const countdownRef = useRef<NodeJS.Timeout>();
+  const fetchInFlightRef = useRef(false);
+  const fetchGenerationRef = useRef(0);
+  const lastFetchAtRef = useRef(0);
 
   const [pollStatus, setPollStatus] = useState<PollStatus>({
     isPolling: false,
@@ -38,11 +41,17 @@ export function useFrontierEvents(options: UseFrontierEventsOptions = {}) {
   });
 
   const fetchEvents = async () => {
+    // Each fetch supersedes any still pending; stale responses are discarded
+    const generation = ++fetchGenerationRef.current;
+    fetchInFlightRef.current = true;
+    lastFetchAtRef.current = Date.now();
+
     try {
       console.log("[useFrontierEvents] Fetching events from backend...");
       setPollStatus((prev) => ({ ...prev, isPolling: true, error: null }));
 
       const response = await fetchFrontierEvents(limit, spikeOnly);
+      if (generation !== fetchGenerationRef.current) return;
 
       console.log(
         `[useFrontierEvents] Received ${response.events.length} events, ` +
@@ -62,12 +71,17 @@ export function useFrontierEvents(options: UseFrontierEventsOptions = {}) {
         },
       }));
     } catch (error) {
+      if (generation !== fetchGenerationRef.current) return;
       console.error("[useFrontierEvents] Error fetching events:", error);
       setPollStatus((prev) => ({
         ...prev,
         isPolling: false,
         error: error instanceof Error ? error.message : "Unknown error",
       }));
+    } finally {
+      if (generation === fetchGenerationRef.current) {
+        fetchInFlightRef.current = false;
+      }
     }
   };
 
@@ -90,22 +104,46 @@ export function useFrontierEvents(options: UseFrontierEventsOptions = {}) {
       });
 
     // Set up polling if interval > 0
+    let handleVisibilityChange: (() => void) | undefined;
     if (pollInterval > 0) {
       console.log(`[useFrontierEvents] Starting polling (interval: ${pollInterval}ms)`);
 
-      // Countdown timer (updates every second)
+      // Countdown timer (updates every second, paused while the tab is hidden)
       countdownRef.current = setInterval(() => {
+        if (document.hidden) return;
         setPollStatus((prev) => ({
           ...prev,
           nextPollIn: Math.max(0, prev.nextPollIn - 1),
         }));
       }, 1000);
 
-      // Polling timer
-      pollRef.current = setInterval(() => {
-        console.log("[useFrontierEvents] Polling for updates...");
+      // Polling timer (skipped while the tab is hidden to spare the backend)
+      const startPollTimer = () => {
+        pollRef.current = setInterval(() => {
+          if (document.hidden) return;
+          // Shed this tick if the previous fetch hasn't returned yet
+          if (fetchInFlightRef.current) {
+            console.log("[useFrontierEvents] Previous fetch still pending, skipping");
+            return;
+          }
+          console.log("[useFrontierEvents] Polling for updates...");
+          fetchEvents();
+        }, pollInterval);
+      };
+      startPollTimer();
+
+      // Catch up when the tab becomes visible again, unless the last fetch
+      // started less than an interval ago; restart the timer so the next
+      // poll comes a full interval after the catch-up
+      handleVisibilityChange = () => {
+        if (document.hidden) return;
+        if (Date.now() - lastFetchAtRef.current < pollInterval) return;
+        console.log("[useFrontierEvents] Tab visible, fetching latest events...");
+        clearInterval(pollRef.current);
+        startPollTimer();
         fetchEvents();
-      }, pollInterval);
+      };
+      document.addEventListener("visibilitychange", handleVisibilityChange);
     }
 
     // Cleanup
@@ -117,6 +155,9 @@ export function useFrontierEvents(options: UseFrontierEventsOptions = {}) {
       if (countdownRef.current) {
         clearInterval(countdownRef.current);
       }
+      if (handleVisibilityChange) {
+        document.removeEventListener("visibilitychange", handleVisibilityChange);
+      }
     };
   }, [limit, spikeOnly, pollInterval]); // Re-fetch if options change
 
@@ -37,7 +37,11 @@ export async function fetchFrontierEvents(
   console.log(`[API] Fetching frontier events (limit: ${limit}, spike_only: ${spikeOnly})`);
 
   try {
-    const url = `${API_BASE}/api/events?limit=${limit}&spike_only=${spikeOnly}`;
+    const params = new URLSearchParams({
+      limit: String(limit),
+      spike_only: String(spikeOnly),
+    });
+    const url = `${API_BASE}/api/events?${params}`;
     const response = await fetch(url);
 
     if (!response.ok) {
@@ -4,15 +4,40 @@ import {
   OrchestratorStatus,
   NewsCard,
   StockData,
-  PriceDataPoint,
 } from "@/lib/types";
 import { getMockTickers } from "@/lib/data/mockTickers";
+import { generateMockPriceHistory } from "@/lib/services/stockApi";
+
+// Orchestrations currently running, keyed by event ID
+const inFlight = new Map<string, Promise<EventDetailData>>();
 
 /**
  * Simulates backend orchestration flow with realistic delays
  * Generates tickers, stock data, and news for an event
+ * Concurrent calls for the same event share one run; status updates
+ * are reported to the caller that started it
+ */
+export function orchestrateEventDetail(
+  event: PolymarketEvent,
+  onStatusUpdate: (status: OrchestratorStatus) => void
+): Promise<EventDetailData> {
+  const pending = inFlight.get(event.id);
+  if (pending) {
+    return pending;
+  }
+
+  const run = runOrchestration(event, onStatusUpdate).finally(() => {
+    inFlight.delete(event.id);
+  });
+  inFlight.set(event.id, run);
+
+  return run;
+}
+
+/**
+ * Run the ticker, price and news steps for an event
  */
-export async function orchestrateEventDetail(
+async function runOrchestration(
   event: PolymarketEvent,
   onStatusUpdate: (status: OrchestratorStatus) => void
 ): Promise<EventDetailData> {
@@ -55,62 +80,7 @@ export async function orchestrateEventDetail(
  * Generate mock stock data with 30-day price history
  */
 function generateMockStockData(symbol: string, eventTimestamp: string): StockData {
-  // Starting price based on symbol (for consistency)
-  const basePrices: Record<string, number> = {
-    AAPL: 185.0,
-    MSFT: 420.0,
-    GOOGL: 145.0,
-    AMZN: 175.0,
-    TSLA: 250.0,
-    NVDA: 880.0,
-    META: 480.0,
-    COIN: 185.0,
-    MSTR: 1450.0,
-    JPM: 195.0,
-    BAC: 38.0,
-    LMT: 475.0,
-    BA: 185.0,
-    XOM: 112.0,
-    CVX: 158.0,
-    DKNG: 42.0,
-    NKE: 108.0,
-    DIS: 112.0,
-    SPY: 500.0,
-    QQQ: 450.0,
-    VTI: 260.0,
-    RIOT: 14.5,
-    MARA: 18.2,
-    AMD: 182.0,
-    COP: 124.0,
-    GD: 285.0,
-    NOC: 490.0,
-    PENN: 28.5,
-  };
-
-  const basePrice = basePrices[symbol] || 100.0;
-
-  // Generate 30 days of price history using random walk
-  const priceHistory: PriceDataPoint[] = [];
-  let currentPrice = basePrice;
-
-  const now = new Date();
-  for (let i = 29; i >= 0; i--) {
-    const date = new Date(now);
-    date.setDate(date.getDate() - i);
-
-    // Random walk: ±2% per day
-    const changePercent = (Math.random() - 0.5) * 0.04; // -2% to +2%
-    currentPrice = currentPrice * (1 + changePercent);
-
-    // Generate volume (in millions)
-    const volume = Math.floor(Math.random() * 50_000_000 + 10_000_000);
-
-    priceHistory.push({
-      timestamp: date.toISOString(),
-      price: parseFloat(currentPrice.toFixed(2)),
-      volume,
-    });
-  }
+  const priceHistory = generateMockPriceHistory(symbol, 30);
 
   const latestPrice = priceHistory[priceHistory.length - 1].price;
   const yesterdayPrice = priceHistory[priceHistory.length - 2].price;
@@ -38,7 +38,14 @@ export async function fetchStockHistory(
     const from = Math.floor((Date.now() - days * 24 * 60 * 60 * 1000) / 1000);
 
     // Call Finnhub API
-    const url = `https://finnhub.io/api/v1/stock/candle?symbol=${symbol}&resolution=D&from=${from}&to=${to}&token=${apiKey}`;
+    const params = new URLSearchParams({
+      symbol,
+      resolution: "D",
+      from: String(from),
+      to: String(to),
+      token: apiKey,
+    });
+    const url = `https://finnhub.io/api/v1/stock/candle?${params}`;
     const response = await fetch(url);
 
     if (!response.ok) {
@@ -117,7 +124,7 @@ export async function fetchMultipleStocks(symbols: string[]): Promise<Record<str
 /**
  * Generate mock price history for development/fallback
  */
-function generateMockPriceHistory(symbol: string, days: number): PriceDataPoint[] {
+export function generateMockPriceHistory(symbol: string, days: number): PriceDataPoint[] {
   // Base prices for consistency
   const basePrices: Record<string, number> = {
     AAPL: 185.0,